@@ -1,13 +1,31 @@
 #!/usr/bin/env python3
 """Fetch a DBLP BibTeX entry by paper title and print selected fields."""
 
+import base64
 import curses
+import functools
+import gzip
+import hashlib
+import http.client
 import json
+import os
 import re
 import sys
-import textwrap
+import tempfile
+import threading
+import time
+import urllib.error
 import urllib.parse
 import urllib.request
+from pathlib import Path
+from typing import Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
 FIELD_ORDER = [
@@ -22,7 +40,26 @@ FIELD_ORDER = [
     "year",
     "doi",
 ]
+# Built once so render_entry does not rebuild the padding spec per field.
+_FIELD_LINE = (
+    "  {name:<" + str(max(len(field) for field in FIELD_ORDER)) + "} = {{{value}}},"
+)
 MAX_HITS = 10
+USER_AGENT = "dblp-bibtex-fetcher/0.1"
+HTTP_TIMEOUT = 30  # seconds, per socket operation
+MAX_IDLE_CONNECTIONS = 4
+MAX_REDIRECTS = 5
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "dblp-bibtex"
+)
+DEFAULT_CACHE_TTL = 30 * 24 * 60 * 60  # seconds
+_WS_RE = re.compile(r"\s+")
+_BRACES_RE = re.compile(r"[{}]")
+_JOURNAL_TRANS = str.maketrans("", "", "{}.,:;")
+_COMMA_RE = re.compile(r"\s*,\s*")
+_FIELD_NAME_RE = re.compile(r"[\s,]*([A-Za-z_][A-Za-z0-9_-]*)\s*=\s*")
+_ENTRY_TYPE_RE = re.compile(r"[A-Za-z0-9_:-]+")
+_HEADER_RE = re.compile(r"@\s*([A-Za-z0-9_:-]+)\s*{\s*([^,\s]+)")
 JOURNAL_EXPANSIONS = {
     "commun acm": "Communications of the ACM",
     "j acm": "Journal of the ACM",
@@ -47,22 +84,144 @@ AUTHOR_PARTICLES = {
 }
 
 
+_idle_connections: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+_idle_connections_lock = threading.Lock()
+
+
+def _proxy_for(scheme: str, netloc: str) -> urllib.parse.SplitResult | None:
+    """Return the proxy from the *_proxy environment variables for the host."""
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy:
+        return None
+    host = urllib.parse.urlsplit(f"//{netloc}").hostname or netloc
+    if urllib.request.proxy_bypass(host):
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    return urllib.parse.urlsplit(proxy)
+
+
+def _proxy_headers(proxy: urllib.parse.SplitResult) -> dict[str, str]:
+    """Return the Proxy-Authorization header for credentials in the proxy URL."""
+    if proxy.username is None:
+        return {}
+    user = urllib.parse.unquote(proxy.username)
+    password = urllib.parse.unquote(proxy.password or "")
+    token = base64.b64encode(f"{user}:{password}".encode()).decode("ascii")
+    return {"Proxy-Authorization": f"Basic {token}"}
+
+
+def _acquire_connection(
+    scheme: str, netloc: str, proxy: urllib.parse.SplitResult | None
+) -> tuple[http.client.HTTPConnection, bool]:
+    """Return a pooled connection for the host and whether it was reused."""
+    with _idle_connections_lock:
+        idle = _idle_connections.get((scheme, netloc))
+        if idle:
+            return idle.pop(), True
+    if proxy is None:
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=HTTP_TIMEOUT), False
+        return http.client.HTTPConnection(netloc, timeout=HTTP_TIMEOUT), False
+    proxy_host, proxy_port = proxy.hostname, proxy.port or 80
+    if scheme == "https":
+        # Tunnel TLS to the target host through the proxy with CONNECT.
+        connection = http.client.HTTPSConnection(
+            proxy_host, proxy_port, timeout=HTTP_TIMEOUT
+        )
+        connection.set_tunnel(netloc, headers=_proxy_headers(proxy))
+        return connection, False
+    return (
+        http.client.HTTPConnection(proxy_host, proxy_port, timeout=HTTP_TIMEOUT),
+        False,
+    )
+
+
+def _release_connection(
+    scheme: str, netloc: str, connection: http.client.HTTPConnection
+) -> None:
+    """Return a connection to the pool so later requests can reuse it."""
+    with _idle_connections_lock:
+        idle = _idle_connections.setdefault((scheme, netloc), [])
+        if len(idle) < MAX_IDLE_CONNECTIONS:
+            idle.append(connection)
+            return
+    connection.close()
+
+
+def _send_request(
+    scheme: str, netloc: str, path: str
+) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+    """Issue a GET over a pooled keep-alive connection and return its response."""
+    headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"}
+    proxy = _proxy_for(scheme, netloc)
+    target = path
+    if proxy is not None and scheme != "https":
+        # Plain HTTP proxies take the absolute URL in the request line.
+        target = f"{scheme}://{netloc}{path}"
+        headers.update(_proxy_headers(proxy))
+    while True:
+        connection, reused = _acquire_connection(scheme, netloc, proxy)
+        try:
+            connection.request("GET", target, headers=headers)
+            return connection, connection.getresponse()
+        except (http.client.HTTPException, OSError):
+            connection.close()
+            if reused:
+                # The server may have dropped an idle keep-alive connection.
+                continue
+            raise
+
+
+def _fetch(url: str) -> tuple[bytes, str]:
+    """GET the URL over a pooled connection, following redirects.
+
+    Returns the body, gunzipped if needed, and its declared charset.
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        connection, response = _send_request(parts.scheme, parts.netloc, path)
+        try:
+            body = response.read()
+        except (http.client.HTTPException, OSError):
+            connection.close()
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            _release_connection(parts.scheme, parts.netloc, connection)
+        if response.status in (301, 302, 303, 307, 308):
+            location = response.getheader("Location")
+            if location:
+                url = urllib.parse.urljoin(url, location)
+                continue
+        if response.status >= 400:
+            raise urllib.error.HTTPError(
+                url, response.status, response.reason, response.headers, None
+            )
+        if response.getheader("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return body, response.headers.get_content_charset() or "utf-8"
+    raise urllib.error.URLError(f"Too many redirects fetching {url}")
+
+
 def http_get(url: str) -> str:
     """Perform a GET request with a minimal User-Agent and return the body as text."""
-    request = urllib.request.Request(
-        url, headers={"User-Agent": "dblp-bibtex-fetcher/0.1"}
-    )
-    with urllib.request.urlopen(request) as response:
-        charset = response.headers.get_content_charset() or "utf-8"
-        return response.read().decode(charset)
+    body, charset = _fetch(url)
+    return body.decode(charset)
 
 
 def search_hits(title: str) -> list[dict]:
     """Query DBLP for the title and return a list of hit dicts."""
     query = urllib.parse.quote_plus(title)
-    url = f"https://dblp.org/search/publ/api?q={query}&format=json&h={MAX_HITS}"
-    payload = http_get(url)
-    data = json.loads(payload)
+    # c=0 drops the completion-term suggestions, which are never used here.
+    url = f"https://dblp.org/search/publ/api?q={query}&format=json&h={MAX_HITS}&c=0"
+    # Both parsers accept the raw bytes, so skip decoding to str first.
+    payload, _ = _fetch(url)
+    data = _json_loads(payload)
     hits = data.get("result", {}).get("hits", {})
     raw_hits = hits.get("hit") or []
     if isinstance(raw_hits, dict):
@@ -72,10 +231,11 @@ def search_hits(title: str) -> list[dict]:
 
 def describe_hit(info: dict) -> str:
     """Create a one-line description for a hit to show in the menu."""
-    venue = info.get("venue") or info.get("journal") or info.get("booktitle") or ""
-    year = info.get("year", "")
-    title = info.get("title", "")
-    doi = info.get("doi")
+    get = info.get
+    venue = get("venue") or get("journal") or get("booktitle") or ""
+    year = get("year", "")
+    title = get("title", "")
+    doi = get("doi")
     main = f"{venue} {year}".strip()
     suffix = f" — {doi}" if doi else ""
     if main:
@@ -89,6 +249,7 @@ def choose_hit(hits: list[dict]) -> dict:
         return hits[0]
 
     descriptions = [describe_hit(hit.get("info", {})) for hit in hits]
+    hit_count = len(hits)
 
     def choose_with_numbers() -> dict:
         print("Multiple entries found. Type the number to select:")
@@ -96,40 +257,66 @@ def choose_hit(hits: list[dict]) -> dict:
             print(f"  {i}. {desc}")
         while True:
             try:
-                choice = input(f"Select [1-{len(hits)}]: ").strip() or "1"
+                choice = input(f"Select [1-{hit_count}]: ").strip() or "1"
             except EOFError:
                 return hits[0]
             if choice.lower() == "q":
                 raise KeyboardInterrupt
             if choice.isdigit():
                 idx = int(choice) - 1
-                if 0 <= idx < len(hits):
+                if 0 <= idx < hit_count:
                     return hits[idx]
             print("Invalid selection. Try again.")
 
     def selector(stdscr):
         curses.curs_set(0)
         idx = 0
-        while True:
-            stdscr.clear()
-            height, width = stdscr.getmaxyx()
+        short_descs: list[str] = []
+
+        def draw_row(i: int, selected: bool) -> None:
+            height, _ = stdscr.getmaxyx()
+            if i + 1 >= height:
+                return
+            line = short_descs[i]
+            prefix = "> " if selected else "  "
+            attr = curses.A_REVERSE if selected else curses.A_NORMAL
+            stdscr.move(i + 1, 0)
+            stdscr.clrtoeol()
+            stdscr.addstr(i + 1, 0, prefix + line, attr)
+
+        def draw_all() -> None:
+            _, width = stdscr.getmaxyx()
+            limit = width - 4
+            short_descs[:] = [
+                desc if len(desc) <= limit else desc[: max(0, limit - 3)] + "..."
+                for desc in descriptions
+            ]
+            stdscr.erase()
             stdscr.addstr(0, 0, "Select DBLP entry (Up/Down, Enter):")
-            for i, desc in enumerate(descriptions):
-                if i + 1 >= height:
-                    break
-                line = textwrap.shorten(desc, width=width - 4, placeholder="...")
-                prefix = "> " if i == idx else "  "
-                attr = curses.A_REVERSE if i == idx else curses.A_NORMAL
-                stdscr.addstr(i + 1, 0, prefix + line, attr)
+            for i in range(hit_count):
+                draw_row(i, i == idx)
+            stdscr.refresh()
+
+        draw_all()
+        while True:
             key = stdscr.getch()
+            old_idx = idx
             if key in (curses.KEY_UP, ord("k")):
-                idx = (idx - 1) % len(hits)
+                idx = (idx - 1) % hit_count
             elif key in (curses.KEY_DOWN, ord("j")):
-                idx = (idx + 1) % len(hits)
+                idx = (idx + 1) % hit_count
             elif key in (curses.KEY_ENTER, ord("\n"), 10, 13):
                 return hits[idx]
             elif key in (27, ord("q"), ord("Q")):
                 raise KeyboardInterrupt
+            elif key == curses.KEY_RESIZE:
+                draw_all()
+                continue
+            if idx != old_idx:
+                # Only the previously and newly selected rows change.
+                draw_row(old_idx, False)
+                draw_row(idx, True)
+                stdscr.refresh()
 
     if not sys.stdin.isatty() or not sys.stdout.isatty():
         return choose_with_numbers()
@@ -152,6 +339,47 @@ def find_entry_key(title: str) -> str:
     return key
 
 
+def _cache_ttl() -> float:
+    """Return the cache lifetime in seconds from DBLP_CACHE_TTL (0 disables it)."""
+    try:
+        return float(os.environ.get("DBLP_CACHE_TTL", DEFAULT_CACHE_TTL))
+    except ValueError:
+        return DEFAULT_CACHE_TTL
+
+
+def disk_cached(fetch: Callable[[str], str]) -> Callable[[str], str]:
+    """Cache the text returned for each key as a file under CACHE_DIR."""
+
+    @functools.wraps(fetch)
+    def wrapper(key: str) -> str:
+        ttl = _cache_ttl()
+        if ttl <= 0:
+            return fetch(key)
+        path = CACHE_DIR / (hashlib.sha1(key.encode()).hexdigest() + ".bib")
+        try:
+            if time.time() - path.stat().st_mtime < ttl:
+                return path.read_text(encoding="utf-8")
+        except OSError:
+            pass
+        text = fetch(key)
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                    tmp.write(text)
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            pass  # caching is best-effort
+        return text
+
+    return wrapper
+
+
+@disk_cached
 def fetch_bibtex_entry(key: str) -> str:
     """Fetch the BibTeX entry text for a given DBLP key."""
     bib_url = f"https://dblp.org/rec/{key}.bib"
@@ -160,66 +388,130 @@ def fetch_bibtex_entry(key: str) -> str:
 
 def parse_entry_header(bibtex: str) -> tuple[str, str]:
     """Extract the entry type and key from the BibTeX header line."""
-    match = re.search(r"@\s*([A-Za-z0-9_:-]+)\s*{\s*([^,\s]+)", bibtex)
-    if not match:
-        return "entry", "unknown"
-    entry_key = match.group(2)
+    _, _, rest = bibtex.partition("@")
+    type_part, _, rest = rest.partition("{")
+    key_part, comma, _ = rest.partition(",")
+    entry_type = type_part.strip()
+    entry_key = key_part.strip()
+    if (
+        not (comma and _ENTRY_TYPE_RE.fullmatch(entry_type) and entry_key)
+        or any(char.isspace() for char in entry_key)
+    ):
+        # Unusual layout; fall back to the more forgiving regex.
+        match = _HEADER_RE.search(bibtex)
+        if not match:
+            return "entry", "unknown"
+        entry_type, entry_key = match.group(1), match.group(2)
     if entry_key.startswith("DBLP:"):
         entry_key = entry_key.split(":", 1)[1]
     if "/" in entry_key:
         entry_key = entry_key.rsplit("/", 1)[1]
-    return match.group(1), entry_key
+    return entry_type, entry_key
 
 
-def _extract_braced_value(text: str, start_index: int) -> str | None:
-    """Read a brace-wrapped value starting at the opening brace index."""
+def _extract_braced_value(text: str, start_index: int) -> tuple[str, int] | None:
+    """Read a brace-wrapped value starting at the opening brace index.
+
+    Returns the value and the index just past the closing brace.
+    """
     if start_index >= len(text) or text[start_index] != "{":
         return None
     depth = 0
-    value_chars: list[str] = []
     i = start_index + 1
-    while i < len(text):
-        char = text[i]
-        if char == "{":
+    while True:
+        # Jump between braces with str.find and only track the nesting depth.
+        close_index = text.find("}", i)
+        if close_index == -1:
+            return None
+        open_index = text.find("{", i, close_index)
+        if open_index != -1:
             depth += 1
-            value_chars.append(char)
-        elif char == "}":
-            if depth == 0:
-                return "".join(value_chars).strip()
-            depth -= 1
-            value_chars.append(char)
+            i = open_index + 1
+        elif depth == 0:
+            return text[start_index + 1 : close_index].strip(), close_index + 1
         else:
-            value_chars.append(char)
-        i += 1
-    return None
+            depth -= 1
+            i = close_index + 1
 
 
-def _extract_quoted_value(text: str, start_index: int) -> str | None:
-    """Read a quote-wrapped value starting at the opening quote index."""
+def _extract_quoted_value(text: str, start_index: int) -> tuple[str, int] | None:
+    """Read a quote-wrapped value starting at the opening quote index.
+
+    Returns the value and the index just past the closing quote.
+    """
     if start_index >= len(text) or text[start_index] != '"':
         return None
-    value_chars: list[str] = []
-    i = start_index + 1
-    while i < len(text):
-        char = text[i]
-        if char == '"' and text[i - 1] != "\\":
-            return "".join(value_chars).strip()
-        value_chars.append(char)
-        i += 1
-    return None
+    i = text.find('"', start_index + 1)
+    while i != -1 and text[i - 1] == "\\":
+        i = text.find('"', i + 1)
+    if i == -1:
+        return None
+    return text[start_index + 1 : i].strip(), i + 1
+
+
+@functools.lru_cache(maxsize=None)
+def _field_re(field_name: str) -> re.Pattern[str]:
+    """Return the compiled pattern locating a field's opening delimiter."""
+    return re.compile(rf"{re.escape(field_name)}\s*=\s*([{{\"])", re.IGNORECASE)
 
 
 def extract_field_value(bibtex: str, field_name: str) -> str | None:
     """Pull a single field value out of the BibTeX text, handling braces."""
-    pattern = re.compile(rf"{re.escape(field_name)}\s*=\s*([{{\"])", re.IGNORECASE)
-    match = pattern.search(bibtex)
+    match = _field_re(field_name).search(bibtex)
     if not match:
         return None
     delimiter = match.group(1)
     start_index = match.end() - 1  # points at the delimiter
     if delimiter == "{":
-        return _extract_braced_value(bibtex, start_index)
-    return _extract_quoted_value(bibtex, start_index)
+        result = _extract_braced_value(bibtex, start_index)
+    else:
+        result = _extract_quoted_value(bibtex, start_index)
+    return result[0] if result else None
+
+
+def parse_all_fields(bibtex: str) -> dict[str, str]:
+    """Read every field of the entry in one left-to-right pass.
+
+    Field names are lowercased; if a field repeats, the first value wins.
+    If the scan stops before the closing brace (for example on ``#``
+    string concatenation), the fields this script uses are looked up
+    individually with ``extract_field_value`` instead.
+    """
+    fields: dict[str, str] = {}
+    i = bibtex.find("{")
+    if i != -1:
+        i = bibtex.find(",", i)  # skip past the entry key
+    while i != -1:
+        match = _FIELD_NAME_RE.match(bibtex, i)
+        if not match:
+            break
+        name = match.group(1).lower()
+        start_index = match.end()
+        delimiter = bibtex[start_index : start_index + 1]
+        if delimiter == "{":
+            result = _extract_braced_value(bibtex, start_index)
+        elif delimiter == '"':
+            result = _extract_quoted_value(bibtex, start_index)
+        else:
+            # Bare values such as numbers or macros run up to the next delimiter.
+            end = len(bibtex)
+            for stop in (",", "}"):
+                found = bibtex.find(stop, start_index)
+                if found != -1:
+                    end = min(end, found)
+            result = bibtex[start_index:end].strip(), end
+        if result is None:
+            i = -1
+            break
+        value, i = result
+        fields.setdefault(name, value)
+    if i == -1 or not bibtex[i:].lstrip(", \t\r\n").startswith("}"):
+        for name in (*FIELD_ORDER, "crossref"):
+            if name not in fields:
+                value = extract_field_value(bibtex, name)
+                if value is not None:
+                    fields[name] = value
+    return fields
 
 
 def _split_on_spaces(value: str) -> list[str]:
@@ -245,7 +537,7 @@ def _split_on_spaces(value: str) -> list[str]:
 
 def _split_authors(value: str) -> list[str]:
     """Split a BibTeX author field into individual author strings."""
-    normalized = re.sub(r"\s+", " ", value).strip()
+    normalized = _WS_RE.sub(" ", value).strip()
     authors: list[str] = []
     buffer: list[str] = []
     depth = 0
@@ -270,11 +562,11 @@ def _split_authors(value: str) -> list[str]:
 
 def _format_author_name(name: str) -> str:
     """Format a single author name as 'Surname, Given'."""
-    normalized = re.sub(r"\s+", " ", name).strip()
+    normalized = _WS_RE.sub(" ", name).strip()
     if not normalized:
         return normalized
     if "," in normalized:
-        normalized = re.sub(r"\s*,\s*", ", ", normalized)
+        normalized = _COMMA_RE.sub(", ", normalized)
         return normalized
     tokens = _split_on_spaces(normalized)
     if len(tokens) <= 1:
@@ -282,7 +574,7 @@ def _format_author_name(name: str) -> str:
     last_index = len(tokens) - 1
     while last_index > 0:
         candidate = tokens[last_index - 1]
-        stripped = re.sub(r"[{}]", "", candidate)
+        stripped = _BRACES_RE.sub("", candidate)
         if stripped and (stripped[0].islower() or stripped.lower() in AUTHOR_PARTICLES):
             last_index -= 1
             continue
@@ -305,24 +597,25 @@ def format_authors(value: str | None) -> str | None:
 
 def render_entry(entry_type: str, entry_key: str, fields: dict[str, str | None]) -> str:
     """Format the BibTeX entry with only the requested fields."""
-    width = max(len(field) for field in FIELD_ORDER)
     lines = ["%", f"@{entry_type}{{{entry_key},"]
     for name in FIELD_ORDER:
         value = fields.get(name)
         if not value:
             continue
-        value_oneline = re.sub(r"\s+", " ", value).strip()
-        prefix = f"  {name:<{width}} = {{"
-        lines.append(prefix + value_oneline + "},")
+        value_oneline = _WS_RE.sub(" ", value).strip()
+        lines.append(_FIELD_LINE.format(name=name, value=value_oneline))
     lines.append("}")
     return "\n".join(lines)
 
 
 def _normalize_journal_name(value: str) -> str:
     """Normalize a journal name for matching against expansions."""
-    no_braces = re.sub(r"[{}]", "", value)
-    no_punct = re.sub(r"[.,:;]", "", no_braces)
-    return re.sub(r"\s+", " ", no_punct).strip().lower()
+    return _WS_RE.sub(" ", value.translate(_JOURNAL_TRANS)).strip().lower()
+
+
+_JOURNAL_LOOKUP = {
+    _normalize_journal_name(abbrev): full for abbrev, full in JOURNAL_EXPANSIONS.items()
+}
 
 
 def expand_journal_name(value: str | None) -> str | None:
@@ -330,25 +623,34 @@ def expand_journal_name(value: str | None) -> str | None:
     if not value:
         return value
     normalized = _normalize_journal_name(value)
-    return JOURNAL_EXPANSIONS.get(normalized, value)
+    return _JOURNAL_LOOKUP.get(normalized, value)
+
+
+def _needs_crossref(fields: dict[str, str | None]) -> bool:
+    """Return whether a crossref could still supply missing venue metadata.
+
+    DBLP crossrefs carry conference proceedings details, so journal
+    articles and entries that already name their venue gain nothing.
+    """
+    return not (
+        fields.get("journal") or fields.get("booktitle") or fields.get("series")
+    )
 
 
 def merge_crossref_fields(
-    bibtex: str, fields: dict[str, str | None]
+    crossref: str | None, fields: dict[str, str | None]
 ) -> dict[str, str | None]:
-    """Populate missing fields from a crossref entry if available."""
-    if fields.get("booktitle") or fields.get("series"):
-        return fields
-    crossref = extract_field_value(bibtex, "crossref")
-    if not crossref:
+    """Populate missing fields from the crossref entry with the given key."""
+    if not crossref or not _needs_crossref(fields):
         return fields
     try:
         crossref_bibtex = fetch_bibtex_entry(crossref)
     except Exception:
         return fields
+    crossref_fields = parse_all_fields(crossref_bibtex)
     for name in ("booktitle", "series", "year"):
         if not fields.get(name):
-            fields[name] = extract_field_value(crossref_bibtex, name)
+            fields[name] = crossref_fields.get(name)
     return fields
 
 
@@ -361,8 +663,9 @@ def main() -> None:
         key = find_entry_key(title)
         bibtex = fetch_bibtex_entry(key)
         entry_type, entry_key = parse_entry_header(bibtex)
-        fields = {name: extract_field_value(bibtex, name) for name in FIELD_ORDER}
-        fields = merge_crossref_fields(bibtex, fields)
+        all_fields = parse_all_fields(bibtex)
+        fields = {name: all_fields.get(name) for name in FIELD_ORDER}
+        fields = merge_crossref_fields(all_fields.get("crossref"), fields)
         if "author" in fields:
             fields["author"] = format_authors(fields["author"])
         if "journal" in fields: